@@ -7,7 +7,7 @@ from math import ceil, floor, sqrt
 
 import matplotlib.pyplot as plt
 import numpy as np
-from mathprog.linalg import vectors
+from mathprog.linalg import mesh, vectors
 from matplotlib.cm import get_cmap
 from matplotlib.collections import PatchCollection
 from matplotlib.colors import Colormap
@@ -345,8 +345,8 @@ def draw3d(
 
 
 # 3D Shape Drawing
-def vertices(faces: list):
-    return list(set([vertex for face in faces for vertex in face]))
+def vertices(faces: list, tol: float = None):
+    return [tuple(v) for v in mesh.index(faces, tol)[0].tolist()]
 
 
 def component(vector: tuple, direction: tuple):
@@ -361,7 +361,10 @@ def face_to_2d(face: list):
     return [vector_to_2d(vertex) for vertex in face]
 
 
-def normal(face: list):
+def normal(face: list, shared: np.ndarray = None):
+    # Given the shared vertex array from mesh.index, face is a sequence of indices into it
+    if shared is not None:
+        face = shared[list(face)].tolist()
     return vectors.cross(vectors.subtract(face[1], face[0]), vectors.subtract(face[2], face[0]))
 
 
@@ -369,16 +372,18 @@ def render(faces: list, color_map: Colormap = None, light: tuple = (1, 2, 3), li
     if not isinstance(color_map, Colormap):
         color_map = get_cmap("Blues")
 
-    unit_light = vectors.unit(light)
+    unit_light = mesh.unit(np.asarray(light, dtype=np.float64))
+
+    # Shade every face at once from the shared vertex array
+    verts, indices, offsets = mesh.index(faces)
+    unit_normals = mesh.unit(mesh.face_normals(verts, indices, offsets))
+    shades = 1 - unit_normals @ unit_light
 
     polygons = []
-    for face in faces:
-        # Compute normal vector with length 1
-        unit_normal = vectors.unit(normal(face))
+    for start, end, unit_normal, shade in zip(offsets, offsets[1:], unit_normals, shades):
         if unit_normal[2] > 0:
-            # Calculate shading with dot product
-            c = color_map(1 - vectors.dot(unit_normal, unit_light))
-            p = Polygon2D(face_to_2d(face), fill=c, color=lines)
+            c = color_map(shade)
+            p = Polygon2D(verts[indices[start:end], :2].tolist(), fill=c, color=lines)
             polygons.append(p)
 
     draw(*polygons, axes=False, grid=None)
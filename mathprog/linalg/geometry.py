@@ -0,0 +1,188 @@
+import numpy as np
+
+# Polygon collections are stored packed: every vertex in one (N, 2) array, with polygon i
+# made up of vertices[offsets[i] : offsets[i + 1]]
+
+
+def pack(polygons: list[list[tuple]]):
+    sizes = [len(polygon) for polygon in polygons]
+    if not all(sizes):
+        raise ValueError("Polygons must have at least one vertex")
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    vertices = np.array([vertex for polygon in polygons for vertex in polygon], dtype=np.float64)
+    if not polygons:
+        vertices = vertices.reshape(0, 2)
+    if vertices.ndim != 2 or vertices.shape[1] != 2:
+        raise ValueError("Polygons must be made of 2D vertices")
+    return vertices, offsets
+
+
+def regular_polygons(sides, centers=None, radii=None):
+    """Packed vertices of regular polygons, one per entry of `sides`
+
+    Each polygon is generated like vectors.regular_polygon, then scaled by its radius
+    (default 1) and moved to its center (default the origin).
+    """
+    sides = np.atleast_1d(np.asarray(sides))
+    if not np.issubdtype(sides.dtype, np.integer) or (sides < 3).any():
+        raise ValueError("Regular polygons must have a whole number of sides, at least 3")
+    offsets = np.zeros(len(sides) + 1, dtype=np.int64)
+    np.cumsum(sides, out=offsets[1:])
+    centers = np.broadcast_to(0.0 if centers is None else centers, (len(sides), 2))
+    radii = np.broadcast_to(1.0 if radii is None else radii, len(sides))
+
+    polygon = np.repeat(np.arange(len(sides)), sides)
+    angles = 2 * np.pi / sides[polygon] * (np.arange(offsets[-1]) - offsets[polygon])
+    unit = np.column_stack((np.cos(angles), np.sin(angles)))
+    return unit * radii[polygon, None] + centers[polygon], offsets
+
+
+def _next_vertex(vertices: np.ndarray, offsets: np.ndarray):
+    # Index of the vertex following each vertex, wrapping around within its polygon
+    following = np.arange(1, len(vertices) + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+    return vertices[following]
+
+
+def _cross(vertices: np.ndarray, following: np.ndarray):
+    return vertices[:, 0] * following[:, 1] - following[:, 0] * vertices[:, 1]
+
+
+def perimeters(vertices: np.ndarray, offsets: np.ndarray):
+    edges = np.linalg.norm(_next_vertex(vertices, offsets) - vertices, axis=1)
+    return np.add.reduceat(edges, offsets[:-1])
+
+
+def areas(vertices: np.ndarray, offsets: np.ndarray):
+    """Signed shoelace areas, positive for counterclockwise polygons"""
+    cross = _cross(vertices, _next_vertex(vertices, offsets))
+    return np.add.reduceat(cross, offsets[:-1]) / 2
+
+
+def centroids(vertices: np.ndarray, offsets: np.ndarray):
+    """Area centroids, or the mean of the vertices for polygons with (almost) zero area
+
+    A polygon counts as degenerate when its area is below 1e-12 of its perimeter
+    squared, so float noise in nearly collinear polygons doesn't blow up the result.
+    """
+    # Work relative to each polygon's first vertex to keep the cross products small
+    origins = np.repeat(vertices[offsets[:-1]], np.diff(offsets), axis=0)
+    relative = vertices - origins
+    following = _next_vertex(relative, offsets)
+    cross = _cross(relative, following)
+    moments = np.add.reduceat((relative + following) * cross[:, None], offsets[:-1])
+    doubled_areas = np.add.reduceat(cross, offsets[:-1])[:, None]
+    means = np.add.reduceat(relative, offsets[:-1]) / np.diff(offsets)[:, None]
+
+    scale = perimeters(vertices, offsets)[:, None] ** 2
+    area_centroids = np.divide(
+        moments, 3 * doubled_areas, out=means, where=np.abs(doubled_areas) > 1e-12 * scale
+    )
+    return area_centroids + vertices[offsets[:-1]]
+
+
+def pairwise_distances(points_a: np.ndarray, points_b: np.ndarray = None, size: int = 1024):
+    """(N, M) matrix of distances between every point in `points_a` and every point in `points_b`
+
+    Differences are taken directly, `size` rows of `points_a` at a time to bound memory.
+    """
+    points_a = np.asarray(points_a, dtype=np.float64)
+    points_b = points_a if points_b is None else np.asarray(points_b, dtype=np.float64)
+    distances = np.empty((len(points_a), len(points_b)))
+    for start in range(0, len(points_a), size):
+        chunk = points_a[start : start + size]
+        distances[start : start + size] = np.linalg.norm(chunk[:, None] - points_b[None], axis=-1)
+    return distances
+
+
+class KDTree:
+    """k-d tree for nearest neighbour queries without comparing every pair of points"""
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 16):
+        self.points = np.asarray(points, dtype=np.float64)
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(self.points))
+
+        # Nodes are stored as parallel lists; split_dims is -1 for leaves, which cover
+        # self.order[starts[i] : ends[i]]
+        self.split_dims = []
+        self.split_values = []
+        self.children = []
+        self.starts = []
+        self.ends = []
+        self._build(0, len(self.points))
+
+    def _build(self, start: int, end: int):
+        node = len(self.split_dims)
+        self.split_dims.append(-1)
+        self.split_values.append(0.0)
+        self.children.append((-1, -1))
+        self.starts.append(start)
+        self.ends.append(end)
+        if end - start <= self.leaf_size:
+            return node
+
+        # Split at the median of the dimension with the largest spread
+        segment = self.order[start:end]
+        spread = np.ptp(self.points[segment], axis=0)
+        dim = int(np.argmax(spread))
+        if spread[dim] == 0:
+            return node
+        mid = (end - start) // 2
+        segment[:] = segment[np.argpartition(self.points[segment, dim], mid)]
+
+        self.split_dims[node] = dim
+        self.split_values[node] = self.points[segment[mid], dim]
+        self.children[node] = (self._build(start, start + mid), self._build(start + mid, end))
+        return node
+
+    def query(self, points: np.ndarray, k: int = 1):
+        """Distances to and indices of the `k` nearest neighbours of each point"""
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        if not 0 < k <= len(self.points):
+            raise ValueError(f"k must be between 1 and the number of points ({len(self.points)})")
+
+        distances = np.empty((len(points), k))
+        indices = np.empty((len(points), k), dtype=np.int64)
+        for i, point in enumerate(points):
+            distances[i], indices[i] = self._query_point(point, k)
+        return np.sqrt(distances), indices
+
+    def _query_point(self, point: np.ndarray, k: int):
+        best_distances = np.full(k, np.inf)
+        best_indices = np.full(k, -1)
+        stack = [(0, 0.0)]
+        while stack:
+            node, plane_distance = stack.pop()
+            if plane_distance >= best_distances[-1]:
+                continue
+
+            dim = self.split_dims[node]
+            if dim == -1:
+                candidates = self.order[self.starts[node] : self.ends[node]]
+                diff = self.points[candidates] - point
+                distances = np.concatenate((best_distances, np.einsum("ij,ij->i", diff, diff)))
+                indices = np.concatenate((best_indices, candidates))
+                nearest = np.argsort(distances, kind="stable")[:k]
+                best_distances, best_indices = distances[nearest], indices[nearest]
+                continue
+
+            # Visit the side containing the point first, it is pushed last
+            offset = point[dim] - self.split_values[node]
+            left, right = self.children[node]
+            near, far = (left, right) if offset < 0 else (right, left)
+            stack.append((far, offset ** 2))
+            stack.append((near, plane_distance))
+        return best_distances, best_indices
+
+
+def nearest(points: np.ndarray, k: int = 1, leaf_size: int = 16):
+    """The `k` nearest other points to each point in a set"""
+    points = np.asarray(points, dtype=np.float64)
+    distances, indices = KDTree(points, leaf_size).query(points, k + 1)
+
+    # Move each point's own index to the end of its row, then drop that column
+    is_self = indices == np.arange(len(points))[:, None]
+    order = np.argsort(is_self, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(distances, order, 1), np.take_along_axis(indices, order, 1)
@@ -0,0 +1,146 @@
+from itertools import product
+
+import numpy as np
+
+# Meshes are stored indexed: a (V, 3) array of unique vertices, one flat int32 array of
+# vertex indices for all faces, and offsets such that face i is made up of
+# vertices[indices[offsets[i] : offsets[i + 1]]]. This lets faces have different sizes.
+
+
+def weld(points: np.ndarray, tol: float = None):
+    """Merge duplicate points, keeping the order in which they first appear.
+
+    Returns the unique points and, for every input point, the index of the
+    unique point it was merged into. Without `tol` (or with `tol=0`) only exactly
+    equal points are merged. With `tol`, points closer than `tol` are merged
+    transitively, so a chain of points each within `tol` of the next becomes one
+    point, kept at the position of whichever appeared first.
+    """
+    if tol is not None and tol < 0:
+        raise ValueError(f"tol must not be negative, got {tol}")
+
+    points = np.asarray(points, dtype=np.float64)
+    if not len(points):
+        return points, np.empty(0, dtype=np.int32)
+
+    _, first, inverse = np.unique(points, axis=0, return_index=True, return_inverse=True)
+
+    # np.unique sorts its output, so renumber the unique points by first appearance
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    unique = points[first[order]]
+    inverse = rank[inverse.ravel()]
+
+    if tol:
+        kept, merged = _merge_within(unique, tol)
+        unique, inverse = unique[kept], merged[inverse]
+    return unique, inverse.astype(np.int32)
+
+
+def _ranks(values: np.ndarray, column: np.ndarray):
+    # Position of each entry of column in the sorted values, or -1 if it is missing
+    ranks = np.minimum(np.searchsorted(values, column), len(values) - 1)
+    return np.where(values[ranks] == column, ranks, -1)
+
+
+def _pairs_within(points: np.ndarray, tol: float):
+    # Bucket points into a grid with cell size tol, so any point within tol of another
+    # lies in the same or an adjacent cell. Occupied cells get dense integer ids, built
+    # one dimension at a time so the combined keys stay below n * n
+    n, dim = points.shape
+    cells = np.floor(points / tol).astype(np.int64)
+    values = [np.unique(column) for column in cells.T]
+    ranks = [{o: _ranks(v, column + o) for o in (-1, 0, 1)} for v, column in zip(values, cells.T)]
+
+    keys = [None]
+    ids = ranks[0][0]
+    for d in range(1, dim):
+        combined = ids * len(values[d]) + ranks[d][0]
+        keys.append(np.unique(combined))
+        ids = np.searchsorted(keys[d], combined)
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+
+    # Only the zero offset and those after it, as the rest find the same pairs reversed
+    offsets = list(product((-1, 0, 1), repeat=dim))
+    firsts, seconds = [], []
+    for offset in offsets[len(offsets) // 2 :]:
+        # Find the neighbouring cell of each point, dropping points as soon as it is empty
+        ids = ranks[0][offset[0]]
+        candidates = np.flatnonzero(ids >= 0)
+        ids = ids[candidates]
+        for d in range(1, dim):
+            rank = ranks[d][offset[d]][candidates]
+            combined = ids * len(values[d]) + rank
+            ids = np.minimum(np.searchsorted(keys[d], combined), len(keys[d]) - 1)
+            occupied = (rank >= 0) & (keys[d][ids] == combined)
+            candidates, ids = candidates[occupied], ids[occupied]
+
+        # Expand each point into one pair per point in the neighbouring cell
+        lo = np.searchsorted(sorted_ids, ids, "left")
+        counts = np.searchsorted(sorted_ids, ids, "right") - lo
+        first = np.repeat(candidates, counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = order[np.repeat(lo, counts) + within]
+
+        if not any(offset):
+            first, second = first[first < second], second[first < second]
+        close = np.linalg.norm(points[first] - points[second], axis=1) <= tol
+        firsts.append(first[close])
+        seconds.append(second[close])
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _merge_within(points: np.ndarray, tol: float):
+    first, second = _pairs_within(points, tol)
+
+    # Label each point with the lowest index in its cluster by propagating the minimum
+    # label across pairs, with pointer jumping to shorten chains, until nothing changes
+    labels = np.arange(len(points))
+    while True:
+        previous = labels
+        lowest = np.minimum(labels[first], labels[second])
+        labels = labels.copy()
+        np.minimum.at(labels, first, lowest)
+        np.minimum.at(labels, second, lowest)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            break
+
+    kept = np.flatnonzero(labels == np.arange(len(points)))
+    return kept, np.searchsorted(kept, labels)
+
+
+def index(faces: list, tol: float = None):
+    """Convert a list of faces into vertex, index and offset arrays"""
+    sizes = [len(face) for face in faces]
+    offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    if not faces:
+        return np.empty((0, 3)), np.empty(0, dtype=np.int32), offsets
+
+    points = np.array([vertex for face in faces for vertex in face], dtype=np.float64)
+    vertices, indices = weld(points, tol)
+    return vertices, indices, offsets
+
+
+def face_normals(vertices: np.ndarray, indices: np.ndarray, offsets: np.ndarray):
+    # From the first three vertices of each face. Unnormalized, so for triangles each
+    # normal's length is twice the area of the triangle
+    starts = offsets[:-1]
+    v0 = vertices[indices[starts]]
+    return np.cross(vertices[indices[starts + 1]] - v0, vertices[indices[starts + 2]] - v0)
+
+
+def vertex_normals(vertices: np.ndarray, indices: np.ndarray, offsets: np.ndarray):
+    """Average of the normals of the faces sharing each vertex, weighted by face_normals' length"""
+    normals = np.zeros_like(vertices)
+    f_normals = face_normals(vertices, indices, offsets)
+    np.add.at(normals, indices, np.repeat(f_normals, np.diff(offsets), axis=0))
+    return unit(normals)
+
+
+def unit(vectors: np.ndarray):
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths != 0)
@@ -0,0 +1,165 @@
+import os
+import struct
+
+import numpy as np
+
+from mathprog.linalg import mesh
+
+# File layout: a fixed 64 byte header, followed by the vectors as contiguous
+# little-endian float64 and then the faces (if any) as contiguous int32 indices
+MAGIC = b"MPVS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQQQ")
+HEADER_SIZE = 64
+VECTOR_DTYPE = np.dtype("<f8")
+FACE_DTYPE = np.dtype("<i4")
+
+CHUNK_SIZE = 1 << 16
+
+
+def _faces_offset(n_vectors: int, dim: int):
+    return HEADER_SIZE + n_vectors * dim * VECTOR_DTYPE.itemsize
+
+
+def _file_size(n_vectors: int, dim: int, n_faces: int, face_size: int):
+    return _faces_offset(n_vectors, dim) + n_faces * face_size * FACE_DTYPE.itemsize
+
+
+def _header(n_vectors: int, dim: int, n_faces: int, face_size: int):
+    header = HEADER.pack(MAGIC, VERSION, 0, n_vectors, dim, n_faces, face_size)
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def create(path: str, n_vectors: int, dim: int, n_faces: int = 0, face_size: int = 3):
+    """Create a file of the given size and return writable memory maps of its vectors and faces
+
+    Lets data larger than memory be filled in chunk by chunk.
+    """
+    with open(path, "wb") as f:
+        f.write(_header(n_vectors, dim, n_faces, face_size))
+        f.truncate(_file_size(n_vectors, dim, n_faces, face_size))
+    return _map(path, "r+")
+
+
+def write(path: str, vectors, faces=None):
+    vectors = np.asarray(vectors, dtype=VECTOR_DTYPE)
+    if faces is None:
+        faces = np.empty((0, 3), dtype=FACE_DTYPE)
+    faces = np.asarray(faces)
+    if vectors.ndim != 2:
+        raise ValueError(f"Expected an (N, dim) array of vectors, got shape {vectors.shape}")
+    if faces.ndim != 2:
+        raise ValueError(f"Expected an (F, face_size) array of faces, got shape {faces.shape}")
+    if faces.size and not np.issubdtype(faces.dtype, np.integer):
+        raise ValueError(f"Face indices must be integers, got {faces.dtype}")
+    if faces.size and (faces.min() < 0 or faces.max() >= len(vectors)):
+        raise ValueError(f"Face indices must be between 0 and {len(vectors) - 1}")
+    faces = faces.astype(FACE_DTYPE)
+    with open(path, "wb") as f:
+        f.write(_header(*vectors.shape, *faces.shape))
+        f.write(np.ascontiguousarray(vectors).tobytes())
+        f.write(np.ascontiguousarray(faces).tobytes())
+
+
+def write_mesh(path: str, faces: list, tol: float = None):
+    vertices, indices, offsets = mesh.index(faces, tol)
+    sizes = np.diff(offsets)
+    if len(sizes) and not (sizes == sizes[0]).all():
+        raise ValueError("Stored meshes must have faces with the same number of vertices")
+    write(path, vertices, indices.reshape(len(sizes), -1) if len(sizes) else None)
+
+
+def read(path: str):
+    """Memory-map a file, returning its vectors and faces (None if it has no faces)"""
+    return _map(path, "r")
+
+
+def _map(path: str, mode: str):
+    with open(path, "rb") as f:
+        magic, version, _, n_vectors, dim, n_faces, face_size = HEADER.unpack(
+            f.read(HEADER.size)
+        )
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a vector set file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported vector set file version: {version}")
+    expected_size = _file_size(n_vectors, dim, n_faces, face_size)
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(
+            f"{path} is {os.path.getsize(path)} bytes, but its header describes {expected_size}"
+        )
+
+    # np.memmap can't map zero bytes, so empty sections are returned as plain arrays
+    if n_vectors:
+        vectors = np.memmap(
+            path, dtype=VECTOR_DTYPE, mode=mode, offset=HEADER_SIZE, shape=(n_vectors, dim)
+        )
+    else:
+        vectors = np.empty((0, dim), dtype=VECTOR_DTYPE)
+
+    faces = None
+    if n_faces:
+        faces = np.memmap(
+            path,
+            dtype=FACE_DTYPE,
+            mode=mode,
+            offset=_faces_offset(n_vectors, dim),
+            shape=(n_faces, face_size),
+        )
+    return vectors, faces
+
+
+def chunks(array: np.ndarray, size: int = CHUNK_SIZE):
+    """Yield consecutive slices of at most `size` rows, loaded into memory one at a time"""
+    for start in range(0, len(array), size):
+        yield np.asarray(array[start : start + size])
+
+
+def _check_same_length(vectors_a: np.ndarray, vectors_b: np.ndarray):
+    if len(vectors_a) != len(vectors_b):
+        raise ValueError(f"Vector sets differ in length: {len(vectors_a)} and {len(vectors_b)}")
+
+
+# Streaming versions of the functions in mathprog.linalg.vectors, each yielding one
+# result array per chunk
+def lengths(vectors: np.ndarray, size: int = CHUNK_SIZE):
+    for chunk in chunks(vectors, size):
+        yield np.linalg.norm(chunk, axis=1)
+
+
+def dots(vectors_a: np.ndarray, vectors_b: np.ndarray, size: int = CHUNK_SIZE):
+    _check_same_length(vectors_a, vectors_b)
+    pairs = zip(chunks(vectors_a, size), chunks(vectors_b, size))
+    return (np.einsum("ij,ij->i", a, b) for a, b in pairs)
+
+
+def distances(vectors_a: np.ndarray, vectors_b: np.ndarray, size: int = CHUNK_SIZE):
+    _check_same_length(vectors_a, vectors_b)
+    pairs = zip(chunks(vectors_a, size), chunks(vectors_b, size))
+    return (np.linalg.norm(a - b, axis=1) for a, b in pairs)
+
+
+def perimeter(vectors: np.ndarray, size: int = CHUNK_SIZE):
+    total = 0.0
+    previous = None
+    for chunk in chunks(vectors, size):
+        # Carry the last vertex over so the edge spanning two chunks is counted
+        if previous is not None:
+            chunk = np.concatenate((previous, chunk))
+        total += np.linalg.norm(np.diff(chunk, axis=0), axis=1).sum()
+        previous = chunk[-1:]
+
+    if previous is not None:
+        total += np.linalg.norm(vectors[0] - previous[0])
+    return total
+
+
+def shades(
+    vertices: np.ndarray, faces: np.ndarray, light: tuple = (1, 2, 3), size: int = CHUNK_SIZE
+):
+    """Yield the visibility and shade of each face, matching draw.render"""
+    unit_light = mesh.unit(np.asarray(light, dtype=np.float64))
+    for chunk in chunks(faces, size):
+        offsets = np.arange(len(chunk) + 1) * chunk.shape[1]
+        unit_normals = mesh.unit(mesh.face_normals(vertices, chunk.ravel(), offsets))
+        yield unit_normals[:, 2] > 0, 1 - unit_normals @ unit_light
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from math import cos, sin
+
+import numpy as np
+
+
+class Transform:
+    """A pipeline of linear and affine steps applied to `dim` dimensional vectors
+
+    Each step is stored as a homogeneous matrix. The steps are only composed into a
+    single matrix the first time the transform is applied, after which the result is
+    reused for every batch of vectors.
+    """
+
+    def __init__(self, dim: int = 2, steps: tuple = ()):
+        self.dim = dim
+        self.steps = tuple(self._check_step(step) for step in steps)
+        self._matrix = None
+
+    def _check_step(self, step: np.ndarray):
+        step = np.asarray(step, dtype=np.float64)
+        if step.shape != (self.dim + 1, self.dim + 1):
+            raise ValueError(f"Expected a {self.dim + 1}x{self.dim + 1} homogeneous matrix")
+        if not np.array_equal(step[self.dim], np.identity(self.dim + 1)[self.dim]):
+            raise ValueError("Only affine steps are supported, the last row must be [0, ..., 0, 1]")
+        return step
+
+    def then(self, other: Transform | np.ndarray):
+        if isinstance(other, Transform):
+            if other.dim != self.dim:
+                raise ValueError(f"Cannot chain a {other.dim}D transform onto a {self.dim}D one")
+            return Transform(self.dim, self.steps + other.steps)
+        return Transform(self.dim, self.steps + (other,))
+
+    def linear(self, matrix: tuple[tuple]):
+        step = np.identity(self.dim + 1)
+        step[: self.dim, : self.dim] = matrix
+        return self.then(step)
+
+    def scale(self, factor: float | tuple):
+        return self.linear(np.diag(np.broadcast_to(factor, self.dim)))
+
+    def translate(self, translation: tuple):
+        step = np.identity(self.dim + 1)
+        step[: self.dim, self.dim] = translation
+        return self.then(step)
+
+    def rotate(self, rotation: float, axis: tuple = None):
+        """Rotate counterclockwise by `rotation` radians, about `axis` in 3D"""
+        c, s = cos(rotation), sin(rotation)
+        if self.dim == 2:
+            if axis is not None:
+                raise ValueError("2D rotations do not take an axis")
+            return self.linear(((c, -s), (s, c)))
+        if self.dim != 3 or axis is None:
+            raise ValueError("Rotation is only defined in 2D, or in 3D about an axis")
+
+        # Rodrigues' rotation formula
+        axis = np.asarray(axis, dtype=np.float64)
+        norm = np.linalg.norm(axis)
+        if norm == 0:
+            raise ValueError("Cannot rotate about a zero-length axis")
+        x, y, z = axis / norm
+        k = np.array(((0, -z, y), (z, 0, -x), (-y, x, 0)))
+        return self.linear(np.identity(3) + s * k + (1 - c) * k @ k)
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            matrix = np.identity(self.dim + 1)
+            for step in self.steps:
+                matrix = step @ matrix
+            self._matrix = matrix
+        return self._matrix
+
+    def apply(self, vectors) -> np.ndarray:
+        """Transform an (N, dim) batch of vectors with a single matrix multiply"""
+        vectors = np.asarray(vectors, dtype=np.float64)
+        matrix = self.matrix
+        return vectors @ matrix[: self.dim, : self.dim].T + matrix[: self.dim, self.dim]
+
+    def __call__(self, vector: tuple) -> tuple:
+        return tuple(self.apply(vector).tolist())
+
+    def __repr__(self):
+        return f"Transform(dim={self.dim}, steps={len(self.steps)})"
@@ -1,3 +1,4 @@
+from itertools import chain
 from math import acos, atan2, cos, pi, sin, sqrt
 
 from mathprog.generic import fraction
@@ -25,11 +26,11 @@ def translate(vector: tuple, translation: tuple):
 
 
 def distance(vector_a: tuple, vector_b: tuple):
-    return length(subtract(vector_a, vector_b))
+    return sqrt(sum((a - b) ** 2 for a, b in zip(vector_a, vector_b)))
 
 
 def perimeter(vectors: list[tuple]):
-    return sum([distance(vectors[i], vectors[(i + 1) % len(vectors)]) for i in range(len(vectors))])
+    return sum(map(distance, vectors, chain(vectors[1:], vectors[:1])))
 
 
 def to_cartesian(polar_vector: tuple):
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from mathprog.linalg import geometry, vectors
+
+
+def test_polygon_kernels():
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    collinear = [(0, 0), (1, 1), (2, 2)]
+    vertices, offsets = geometry.pack([square, collinear])
+    assert geometry.perimeters(vertices, offsets) == pytest.approx(
+        [vectors.perimeter(square), vectors.perimeter(collinear)]
+    )
+    assert geometry.areas(vertices, offsets).tolist() == [4, 0]
+    assert geometry.centroids(vertices, offsets).tolist() == [[1, 1], [1, 1]]
+
+
+def test_pack_rejects_3d():
+    with pytest.raises(ValueError):
+        geometry.pack([[(0, 0, 0), (1, 0, 0), (1, 1, 0)]])
+
+
+def test_pairwise_distances_far_from_origin():
+    point = np.array([[1e6, 1e6]])
+    assert geometry.pairwise_distances(point, point + [1e-3, 0]) == pytest.approx(1e-3)
+
+
+def test_kdtree_matches_brute_force():
+    points = np.random.default_rng(0).random((500, 2))
+    queries = np.random.default_rng(1).random((50, 2))
+    distances, indices = geometry.KDTree(points, leaf_size=4).query(queries, 5)
+    expected = np.sort(geometry.pairwise_distances(queries, points), axis=1)[:, :5]
+    assert distances == pytest.approx(expected)
+    assert np.linalg.norm(points[indices] - queries[:, None], axis=-1) == pytest.approx(expected)
+
+
+def test_nearest_excludes_self():
+    _, indices = geometry.nearest(np.zeros((5, 2)), 2)
+    assert not (indices == np.arange(5)[:, None]).any()
+
+
+def test_centroids_of_nearly_degenerate_polygon():
+    vertices, offsets = geometry.pack([[(0.1, 0.3), (0.4, 0.9), (0.7, 1.5)]])
+    assert geometry.areas(vertices, offsets)[0] != 0
+    assert geometry.centroids(vertices, offsets) == pytest.approx(np.array([[0.4, 0.9]]))
+
+
+def test_regular_polygons():
+    vertices, offsets = geometry.regular_polygons([3, 4], centers=[(0, 0), (5, 5)], radii=[1, 2])
+    assert offsets.tolist() == [0, 3, 7]
+    assert vertices[:3] == pytest.approx(np.array(vectors.regular_polygon(3)))
+    assert geometry.centroids(vertices, offsets) == pytest.approx(np.array([(0, 0), (5, 5)]))
+    assert geometry.perimeters(vertices, offsets)[1] == pytest.approx(8 * 2 ** 0.5)
+    with pytest.raises(ValueError):
+        geometry.regular_polygons([3, 2])
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from mathprog.linalg import draw, mesh
+
+
+def test_weld_renumbers_by_first_appearance():
+    points = [(2, 0, 0), (1, 0, 0), (2, 0, 0), (0, 0, 0), (1, 0, 0)]
+    vertices, indices = mesh.weld(points)
+    assert vertices.tolist() == [[2, 0, 0], [1, 0, 0], [0, 0, 0]]
+    assert indices.tolist() == [0, 1, 0, 2, 1]
+    assert indices.dtype == np.int32
+
+
+def test_weld_merges_across_grid_cells():
+    vertices, indices = mesh.weld([(0.49, 0, 0), (0.51, 0, 0), (2, 0, 0)], tol=1.0)
+    assert vertices.tolist() == [[0.49, 0, 0], [2, 0, 0]]
+    assert indices.tolist() == [0, 0, 1]
+
+
+def test_weld_merges_chains():
+    points = [(0, 0, 0), (0.9, 0, 0), (1.8, 0, 0), (5, 0, 0), (0, 0, 0)]
+    vertices, indices = mesh.weld(points, tol=1.0)
+    assert vertices.tolist() == [[0, 0, 0], [5, 0, 0]]
+    assert indices.tolist() == [0, 0, 0, 1, 0]
+
+
+def test_weld_matches_brute_force():
+    points = np.random.default_rng(0).random((200, 3))
+    _, indices = mesh.weld(points, tol=0.1)
+
+    # Propagate the lowest index across every pair within tol until clusters settle
+    close = np.linalg.norm(points[:, None] - points[None], axis=-1) <= 0.1
+    labels = np.arange(len(points))
+    for _ in range(len(points)):
+        labels = np.where(close, labels[None], len(points)).min(axis=1)
+    assert np.array_equal(indices[:, None] == indices[None], labels[:, None] == labels[None])
+
+
+def test_weld_tolerance_bounds():
+    points = [(0, 0, 0), (1e-9, 0, 0)]
+    assert mesh.weld(points, tol=0)[1].tolist() == [0, 1]
+    with pytest.raises(ValueError):
+        mesh.weld(points, tol=-1)
+
+
+def test_index_mixed_face_sizes():
+    quad = ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0))
+    triangle = ((1, 0, 0), (1, 1, 0), (1, 0, 1))
+    vertices, indices, offsets = mesh.index([quad, triangle])
+    assert len(vertices) == 5
+    assert indices.tolist() == [0, 1, 2, 3, 1, 2, 4]
+    assert offsets.tolist() == [0, 4, 7]
+    assert mesh.face_normals(vertices, indices, offsets).tolist() == [[0, 0, 1], [1, 0, 0]]
+    assert draw.normal(indices[4:7], vertices) == draw.normal(triangle)
+
+
+def test_vertices_empty():
+    assert draw.vertices([]) == []
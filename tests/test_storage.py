@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from mathprog.linalg import storage, vectors
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "mesh.mpvs"
+    storage.write(path, [(0, 0, 0), (1, 0, 0), (0, 1, 0)], [(0, 1, 2)])
+    vertices, faces = storage.read(path)
+    assert vertices.tolist() == [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    assert faces.tolist() == [[0, 1, 2]]
+
+
+@pytest.mark.parametrize("size", [1, 3, 4, 100])
+def test_perimeter_across_chunks(size):
+    square = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float64)
+    assert storage.perimeter(square, size) == pytest.approx(4)
+    assert storage.perimeter(np.empty((0, 2)), size) == 0
+
+
+def test_distances_match_vectors():
+    a = np.random.default_rng(0).random((10, 3))
+    b = np.random.default_rng(1).random((10, 3))
+    result = np.concatenate(list(storage.distances(a, b, 3)))
+    assert result == pytest.approx([vectors.distance(u, v) for u, v in zip(a, b)])
+
+
+def test_rejects_mismatched_input(tmp_path):
+    with pytest.raises(ValueError):
+        storage.write(tmp_path / "bad.mpvs", [1, 2, 3])
+    with pytest.raises(ValueError):
+        storage.dots(np.ones((3, 2)), np.ones((2, 2)))
+    for faces in ([(0, 1, 3)], [(-1, 0, 1)], [(0, 1, 2 ** 31)]):
+        with pytest.raises(ValueError):
+            storage.write(tmp_path / "bad.mpvs", [(0, 0), (1, 0), (0, 1)], faces)
+
+
+def test_rejects_truncated_file(tmp_path):
+    path = tmp_path / "truncated.mpvs"
+    storage.write(path, np.ones((10, 3)))
+    with open(path, "r+b") as f:
+        f.truncate(100)
+    with pytest.raises(ValueError, match="header"):
+        storage.read(path)
@@ -0,0 +1,30 @@
+from math import pi
+
+import numpy as np
+import pytest
+
+from mathprog.linalg.transforms import Transform
+
+
+def test_steps_apply_in_order():
+    transform = Transform().rotate(pi / 2).scale(2).translate((1, 0))
+    assert transform((1, 0)) == pytest.approx((1, 2))
+    assert transform.apply([(1, 0), (0, 1)]) == pytest.approx(np.array([(1, 2), (-1, 0)]))
+
+
+def test_rotate_about_axis():
+    assert Transform(3).rotate(pi / 2, (0, 0, 2))((1, 0, 0)) == pytest.approx((0, 1, 0))
+
+
+def test_rejects_projective_steps():
+    projective = np.identity(3)
+    projective[2, 0] = 1
+    with pytest.raises(ValueError):
+        Transform().then(projective)
+    with pytest.raises(ValueError):
+        Transform(2, (projective,))
+
+
+def test_rejects_zero_axis():
+    with pytest.raises(ValueError):
+        Transform(3).rotate(1, (0, 0, 0))